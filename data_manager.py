@@ -3,30 +3,134 @@ Data Manager Module
 Handles all data persistence operations including user profiles, texts, and results.
 """
 
+import copy
+import functools
 import json
 import os
 import re
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional, the stdlib json module gives the same files
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(data, indent: bool = True) -> bytes:
+        """Serialize data to UTF-8 JSON bytes."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    
+    _loads = orjson.loads
+else:
+    def _dumps(data, indent: bool = True) -> bytes:
+        """Serialize data to UTF-8 JSON bytes."""
+        return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+    
+    _loads = json.loads
+
+
+# Characters clean_quran_text deletes, as one precompiled class:
+# \u0610-\u061A: Quranic small marks
+# \u064B-\u065F: Harakat, Shadda, Sukun, Maddah, Hamza above/below
+# \u0670: Superscript Alef
+# \u06D6-\u06ED: Quranic pause and start/stop signs
+# Sajda symbols, digits, brackets and punctuation common in some datasets
+_QURAN_STRIP_RE = re.compile(
+    r'[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED۞۩0-9\(\)\[\]\{\}«»\.,;!؟?]+'
+)
+
+# Key in a text library file holding the next custom-text number per difficulty
+_COUNTERS_KEY = "_counters"
+
+# Built-in text libraries, written out on first run
+_DEFAULT_ARABIC_TEXTS = {
+    "beginner": [
+        {"id": "ar_b_001", "text": "السلام عليكم ورحمة الله وبركاته", "difficulty": "beginner"},
+        {"id": "ar_b_002", "text": "الحمد لله رب العالمين", "difficulty": "beginner"},
+        {"id": "ar_b_003", "text": "بسم الله الرحمن الرحيم", "difficulty": "beginner"},
+        {"id": "ar_b_004", "text": "العلم نور والجهل ظلام", "difficulty": "beginner"},
+        {"id": "ar_b_005", "text": "الصبر مفتاح الفرج", "difficulty": "beginner"},
+    ],
+    "intermediate": [
+        {"id": "ar_i_001", "text": "التعليم هو السلاح الأقوى الذي يمكنك استخدامه لتغيير العالم", "difficulty": "intermediate"},
+        {"id": "ar_i_002", "text": "النجاح ليس نهاية والفشل ليس قاتلا إنها الشجاعة للاستمرار هي التي تهم", "difficulty": "intermediate"},
+        {"id": "ar_i_003", "text": "الطريق إلى النجاح دائما تحت الإنشاء", "difficulty": "intermediate"},
+        {"id": "ar_i_004", "text": "لا تقل أبدا أنك لا تستطيع فعل شيء ما قبل أن تحاول", "difficulty": "intermediate"},
+        {"id": "ar_i_005", "text": "القراءة تصنع إنسانا كاملا والمناقشة تصنع إنسانا مستعدا والكتابة تصنع إنسانا دقيقا", "difficulty": "intermediate"},
+    ],
+    "advanced": [
+        {"id": "ar_a_001", "text": "إن الذين آمنوا وعملوا الصالحات كانت لهم جنات الفردوس نزلا خالدين فيها لا يبغون عنها حولا", "difficulty": "advanced"},
+        {"id": "ar_a_002", "text": "العلم في الصغر كالنقش على الحجر والعلم في الكبر كالنقش على الماء فاغتنم فرصة التعلم في شبابك", "difficulty": "advanced"},
+        {"id": "ar_a_003", "text": "إذا أردت أن تكون ناجحا فعليك أن تحترم قاعدة واحدة لا تكذب أبدا على نفسك", "difficulty": "advanced"},
+        {"id": "ar_a_004", "text": "الحياة مثل ركوب الدراجة للحفاظ على توازنك يجب أن تستمر في التحرك", "difficulty": "advanced"},
+        {"id": "ar_a_005", "text": "المعرفة قوة والمعلومات حرية والتعليم هو مقدمة التقدم في كل مجتمع وفي كل عائلة", "difficulty": "advanced"},
+    ]
+}
+
+_DEFAULT_ENGLISH_TEXTS = {
+    "beginner": [
+        {"id": "en_b_001", "text": "The quick brown fox jumps over the lazy dog", "difficulty": "beginner"},
+        {"id": "en_b_002", "text": "Practice makes perfect", "difficulty": "beginner"},
+        {"id": "en_b_003", "text": "Hello world welcome to typing", "difficulty": "beginner"},
+        {"id": "en_b_004", "text": "Learning to type is fun", "difficulty": "beginner"},
+        {"id": "en_b_005", "text": "Speed and accuracy matter", "difficulty": "beginner"},
+    ],
+    "intermediate": [
+        {"id": "en_i_001", "text": "Education is the most powerful weapon which you can use to change the world", "difficulty": "intermediate"},
+        {"id": "en_i_002", "text": "Success is not final failure is not fatal it is the courage to continue that counts", "difficulty": "intermediate"},
+        {"id": "en_i_003", "text": "The only way to do great work is to love what you do", "difficulty": "intermediate"},
+        {"id": "en_i_004", "text": "Believe you can and you are halfway there", "difficulty": "intermediate"},
+        {"id": "en_i_005", "text": "The future belongs to those who believe in the beauty of their dreams", "difficulty": "intermediate"},
+    ],
+    "advanced": [
+        {"id": "en_a_001", "text": "In the midst of chaos there is also opportunity and the wise man will find a way to turn obstacles into stepping stones", "difficulty": "advanced"},
+        {"id": "en_a_002", "text": "The greatest glory in living lies not in never falling but in rising every time we fall", "difficulty": "advanced"},
+        {"id": "en_a_003", "text": "Life is what happens when you are busy making other plans so embrace the unexpected", "difficulty": "advanced"},
+        {"id": "en_a_004", "text": "The only impossible journey is the one you never begin so take that first step today", "difficulty": "advanced"},
+        {"id": "en_a_005", "text": "Knowledge is power information is liberating education is the premise of progress in every society", "difficulty": "advanced"},
+    ]
+}
+
 
 class DataManager:
     """Manages all data storage and retrieval operations."""
     
+    # Data directories already set up in this process
+    _initialized: set = set()
+    
     def __init__(self, data_dir: str = "data"):
         self.data_dir = data_dir
         self.users_file = os.path.join(data_dir, "users.json")
         self.texts_arabic_file = os.path.join(data_dir, "texts_arabic.json")
         self.texts_english_file = os.path.join(data_dir, "texts_english.json")
-        self.results_file = os.path.join(data_dir, "results.json")
+        self.results_file = os.path.join(data_dir, "results.ndjson")
+        self.legacy_results_file = os.path.join(data_dir, "results.json")
+        self.stats_cache_file = os.path.join(data_dir, "stats_cache.json")
         self.quran_raw_file = os.path.join(data_dir, "quran_raw.json")
         self.quran_progress_file = os.path.join(data_dir, "quran_progress.json")
         
-        # Create data directory if it doesn't exist
-        os.makedirs(data_dir, exist_ok=True)
+        # Parsed JSON per file path, keyed by the file's mtime at parse time
+        self._cache: Dict[str, tuple] = {}
+        
+        # Text library per language, loaded on first use
+        self._texts_cache: Dict[str, Dict] = {}
+        # get_texts results per (language, difficulty), cleared when texts are edited
+        self._texts_lists: Dict[tuple, List[Dict]] = {}
         
-        # Initialize data files
-        self._initialize_data_files()
+        # Derived views, dropped or replaced whenever the data behind them is written
+        self._stats_cache: Optional[Dict] = None
+        self._progress_cache: Optional[Dict] = None
+        
+        # Create data directory and default files once per directory
+        dir_key = os.path.abspath(data_dir)
+        if dir_key not in DataManager._initialized:
+            os.makedirs(data_dir, exist_ok=True)
+            self._initialize_data_files()
+            DataManager._initialized.add(dir_key)
     
     def _initialize_data_files(self):
         """Initialize data files with default content if they don't exist."""
@@ -36,87 +140,87 @@ class DataManager:
         
         # Initialize Arabic texts
         if not os.path.exists(self.texts_arabic_file):
-            default_arabic_texts = {
-                "beginner": [
-                    {"id": "ar_b_001", "text": "السلام عليكم ورحمة الله وبركاته", "difficulty": "beginner"},
-                    {"id": "ar_b_002", "text": "الحمد لله رب العالمين", "difficulty": "beginner"},
-                    {"id": "ar_b_003", "text": "بسم الله الرحمن الرحيم", "difficulty": "beginner"},
-                    {"id": "ar_b_004", "text": "العلم نور والجهل ظلام", "difficulty": "beginner"},
-                    {"id": "ar_b_005", "text": "الصبر مفتاح الفرج", "difficulty": "beginner"},
-                ],
-                "intermediate": [
-                    {"id": "ar_i_001", "text": "التعليم هو السلاح الأقوى الذي يمكنك استخدامه لتغيير العالم", "difficulty": "intermediate"},
-                    {"id": "ar_i_002", "text": "النجاح ليس نهاية والفشل ليس قاتلا إنها الشجاعة للاستمرار هي التي تهم", "difficulty": "intermediate"},
-                    {"id": "ar_i_003", "text": "الطريق إلى النجاح دائما تحت الإنشاء", "difficulty": "intermediate"},
-                    {"id": "ar_i_004", "text": "لا تقل أبدا أنك لا تستطيع فعل شيء ما قبل أن تحاول", "difficulty": "intermediate"},
-                    {"id": "ar_i_005", "text": "القراءة تصنع إنسانا كاملا والمناقشة تصنع إنسانا مستعدا والكتابة تصنع إنسانا دقيقا", "difficulty": "intermediate"},
-                ],
-                "advanced": [
-                    {"id": "ar_a_001", "text": "إن الذين آمنوا وعملوا الصالحات كانت لهم جنات الفردوس نزلا خالدين فيها لا يبغون عنها حولا", "difficulty": "advanced"},
-                    {"id": "ar_a_002", "text": "العلم في الصغر كالنقش على الحجر والعلم في الكبر كالنقش على الماء فاغتنم فرصة التعلم في شبابك", "difficulty": "advanced"},
-                    {"id": "ar_a_003", "text": "إذا أردت أن تكون ناجحا فعليك أن تحترم قاعدة واحدة لا تكذب أبدا على نفسك", "difficulty": "advanced"},
-                    {"id": "ar_a_004", "text": "الحياة مثل ركوب الدراجة للحفاظ على توازنك يجب أن تستمر في التحرك", "difficulty": "advanced"},
-                    {"id": "ar_a_005", "text": "المعرفة قوة والمعلومات حرية والتعليم هو مقدمة التقدم في كل مجتمع وفي كل عائلة", "difficulty": "advanced"},
-                ]
-            }
-            self._save_json(self.texts_arabic_file, default_arabic_texts)
+            self._save_json(self.texts_arabic_file, copy.deepcopy(_DEFAULT_ARABIC_TEXTS))
         
         # Initialize English texts
         if not os.path.exists(self.texts_english_file):
-            default_english_texts = {
-                "beginner": [
-                    {"id": "en_b_001", "text": "The quick brown fox jumps over the lazy dog", "difficulty": "beginner"},
-                    {"id": "en_b_002", "text": "Practice makes perfect", "difficulty": "beginner"},
-                    {"id": "en_b_003", "text": "Hello world welcome to typing", "difficulty": "beginner"},
-                    {"id": "en_b_004", "text": "Learning to type is fun", "difficulty": "beginner"},
-                    {"id": "en_b_005", "text": "Speed and accuracy matter", "difficulty": "beginner"},
-                ],
-                "intermediate": [
-                    {"id": "en_i_001", "text": "Education is the most powerful weapon which you can use to change the world", "difficulty": "intermediate"},
-                    {"id": "en_i_002", "text": "Success is not final failure is not fatal it is the courage to continue that counts", "difficulty": "intermediate"},
-                    {"id": "en_i_003", "text": "The only way to do great work is to love what you do", "difficulty": "intermediate"},
-                    {"id": "en_i_004", "text": "Believe you can and you are halfway there", "difficulty": "intermediate"},
-                    {"id": "en_i_005", "text": "The future belongs to those who believe in the beauty of their dreams", "difficulty": "intermediate"},
-                ],
-                "advanced": [
-                    {"id": "en_a_001", "text": "In the midst of chaos there is also opportunity and the wise man will find a way to turn obstacles into stepping stones", "difficulty": "advanced"},
-                    {"id": "en_a_002", "text": "The greatest glory in living lies not in never falling but in rising every time we fall", "difficulty": "advanced"},
-                    {"id": "en_a_003", "text": "Life is what happens when you are busy making other plans so embrace the unexpected", "difficulty": "advanced"},
-                    {"id": "en_a_004", "text": "The only impossible journey is the one you never begin so take that first step today", "difficulty": "advanced"},
-                    {"id": "en_a_005", "text": "Knowledge is power information is liberating education is the premise of progress in every society", "difficulty": "advanced"},
-                ]
-            }
-            self._save_json(self.texts_english_file, default_english_texts)
+            self._save_json(self.texts_english_file, copy.deepcopy(_DEFAULT_ENGLISH_TEXTS))
         
-        # Initialize results file
+        # Initialize results log (one JSON object per line)
         if not os.path.exists(self.results_file):
-            self._save_json(self.results_file, [])
+            self._migrate_legacy_results()
+        
+        # Initialize running statistics from the results log
+        if not os.path.exists(self.stats_cache_file):
+            self._rebuild_stats_cache()
             
         # Initialize Quran progress
         if not os.path.exists(self.quran_progress_file):
             self._save_json(self.quran_progress_file, {"surah_id": 1, "char_index": 0})
     
-    def _load_json(self, filepath: str) -> Dict:
-        """Load JSON data from file."""
+    def _load_json_cached(self, filepath: str) -> Dict:
+        """Load JSON data from file, reusing the cached parse while the file is unchanged."""
+        # Hot path: only used for files _initialize_data_files guarantees exist
+        mtime = os.stat(filepath).st_mtime_ns
+        entry = self._cache.get(filepath)
+        if entry and entry[0] == mtime:
+            return entry[1]
+        
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        try:
+            data = _loads(raw)
+        except ValueError as e:
+            # Existing but unreadable file: treat it as empty until it is rewritten
+            print(f"Error loading {filepath}: {e}")
+            data = {}
+        self._cache[filepath] = (mtime, data)
+        return data
+    
+    def _safe_load(self, filepath: str) -> Dict:
+        """Load JSON data from a file that may be missing or invalid."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self._load_json_cached(filepath)
         except Exception as e:
             print(f"Error loading {filepath}: {e}")
             return {}
     
-    def _save_json(self, filepath: str, data):
-        """Save data to JSON file."""
+    def _migrate_legacy_results(self):
+        """Convert the old results.json array into the NDJSON results log."""
+        results = []
+        if os.path.exists(self.legacy_results_file):
+            results = self._safe_load(self.legacy_results_file) or []
+        
+        try:
+            with open(self.results_file, 'wb') as f:
+                f.write(b"".join(_dumps(r, indent=False) + b"\n" for r in results))
+        except Exception as e:
+            print(f"Error saving {self.results_file}: {e}")
+    
+    def _save_json(self, filepath: str, data) -> bool:
+        """Save data to JSON file and refresh its cache entry. Returns False if the save failed."""
+        tmp_path = filepath + ".tmp"
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # Serialize up front: json.dump issues one write() per token
+            payload = _dumps(data)
+            # Write next to the target and swap it in, so an interrupted save
+            # never leaves a truncated file behind
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, filepath)
+            self._cache[filepath] = (os.stat(filepath).st_mtime_ns, data)
+            return True
         except Exception as e:
+            self._cache.pop(filepath, None)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             print(f"Error saving {filepath}: {e}")
+            return False
     
     # User Management
     def user_exists(self) -> bool:
         """Check if a user profile exists."""
-        user_data = self._load_json(self.users_file)
+        user_data = self._load_json_cached(self.users_file)
         return bool(user_data.get("username"))
     
     def create_user(self, username: str, language: str = "english") -> Dict:
@@ -129,47 +233,64 @@ class DataManager:
             "created_at": datetime.now().isoformat()
         }
         self._save_json(self.users_file, user_data)
-        return user_data
+        # The cache keeps user_data itself, so hand the caller a copy
+        return dict(user_data)
     
     def get_user(self) -> Optional[Dict]:
         """Get user profile."""
-        user_data = self._load_json(self.users_file)
-        return user_data if user_data.get("username") else None
+        user_data = self._load_json_cached(self.users_file)
+        # Copy so callers can tweak session state without touching the cache
+        return dict(user_data) if user_data.get("username") else None
     
     def update_user(self, **kwargs):
         """Update user profile."""
-        user_data = self._load_json(self.users_file)
+        user_data = self._load_json_cached(self.users_file)
         user_data.update(kwargs)
         self._save_json(self.users_file, user_data)
     
     # Text Management
+    def _texts_file(self, language: str) -> str:
+        """Get the text library file for a language."""
+        return self.texts_arabic_file if language == "arabic" else self.texts_english_file
+    
+    def _load_texts(self, language: str) -> Dict:
+        """Get the text library for a language, loading it once."""
+        texts_data = self._texts_cache.get(language)
+        if texts_data is None:
+            texts_data = self._load_json_cached(self._texts_file(language))
+            self._texts_cache[language] = texts_data
+        return texts_data
+    
     def get_texts(self, language: str, difficulty: str = None) -> List[Dict]:
         """Get texts for a specific language and optional difficulty."""
-        if language == "arabic":
-            texts_data = self._load_json(self.texts_arabic_file)
-        else:
-            texts_data = self._load_json(self.texts_english_file)
+        cache_key = (language, difficulty)
+        texts = self._texts_lists.get(cache_key)
+        if texts is not None:
+            return texts
+        
+        texts_data = self._load_texts(language)
         
         if difficulty:
-            return texts_data.get(difficulty, [])
+            texts = texts_data.get(difficulty, [])
         else:
             # Return all texts
-            all_texts = []
-            for diff_texts in texts_data.values():
-                all_texts.extend(diff_texts)
-            return all_texts
+            texts = []
+            for key, diff_texts in texts_data.items():
+                if key != _COUNTERS_KEY:
+                    texts.extend(diff_texts)
+        self._texts_lists[cache_key] = texts
+        return texts
     
     def add_custom_text(self, language: str, text: str, difficulty: str = "intermediate"):
         """Add a custom text to the library."""
-        if language == "arabic":
-            filepath = self.texts_arabic_file
-        else:
-            filepath = self.texts_english_file
-        
-        texts_data = self._load_json(filepath)
+        texts_data = self._load_texts(language)
         
-        # Generate unique ID
-        custom_id = f"{language[:2]}_custom_{len(texts_data.get(difficulty, []))}"
+        # Generate unique ID from a counter that never goes back, so deleting
+        # a text can't make the next one reuse its ID
+        counters = texts_data.setdefault(_COUNTERS_KEY, {})
+        number = counters.get(difficulty, 0)
+        counters[difficulty] = number + 1
+        custom_id = f"{language[:2]}_custom_{difficulty[0]}_{number}"
         
         new_text = {
             "id": custom_id,
@@ -182,32 +303,47 @@ class DataManager:
             texts_data[difficulty] = []
         
         texts_data[difficulty].append(new_text)
-        self._save_json(filepath, texts_data)
+        self._texts_lists.clear()
+        if not self._save_json(self._texts_file(language), texts_data):
+            # texts_data was edited in place; reload it from disk next time
+            self._texts_cache.pop(language, None)
     
     def delete_custom_text(self, language: str, text_id: str):
         """Delete a custom text."""
-        if language == "arabic":
-            filepath = self.texts_arabic_file
-        else:
-            filepath = self.texts_english_file
-        
-        texts_data = self._load_json(filepath)
+        texts_data = self._load_texts(language)
         
         for difficulty in texts_data:
+            if difficulty == _COUNTERS_KEY:
+                continue
             texts_data[difficulty] = [
                 t for t in texts_data[difficulty] 
                 if t["id"] != text_id or not t.get("custom", False)
             ]
         
-        self._save_json(filepath, texts_data)
+        self._texts_lists.clear()
+        if not self._save_json(self._texts_file(language), texts_data):
+            # texts_data was edited in place; reload it from disk next time
+            self._texts_cache.pop(language, None)
     
     # Results Management
     def save_result(self, result: Dict):
         """Save a test result."""
-        results = self._load_json(self.results_file)
         result["timestamp"] = datetime.now().isoformat()
-        results.append(result)
-        self._save_json(self.results_file, results)
+        
+        # Read the totals before appending, so a rebuild from the log
+        # can't count this result twice
+        totals = self._load_stats_totals()
+        
+        try:
+            with open(self.results_file, 'ab') as f:
+                f.write(_dumps(result, indent=False) + b"\n")
+        except Exception as e:
+            print(f"Error saving {self.results_file}: {e}")
+        
+        # Update running statistics
+        self._add_to_stats_totals(totals, result)
+        self._save_json(self.stats_cache_file, totals)
+        self._stats_cache = None
         
         # Update user stats
         user = self.get_user()
@@ -222,17 +358,76 @@ class DataManager:
     
     def get_results(self, limit: int = None) -> List[Dict]:
         """Get test results, optionally limited to most recent."""
-        results = self._load_json(self.results_file)
-        if limit:
-            return results[-limit:]
-        return results
+        try:
+            with open(self.results_file, 'rb') as f:
+                # Only the last `limit` lines are kept in memory
+                lines = deque(f, maxlen=limit) if limit else f
+                results = []
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        results.append(_loads(line))
+                    except ValueError as e:
+                        # e.g. a line cut short by an interrupted append
+                        print(f"Skipping bad line in {self.results_file}: {e}")
+                return results
+        except Exception as e:
+            print(f"Error loading {self.results_file}: {e}")
+            return []
+    
+    def _empty_stats_totals(self) -> Dict:
+        """Running totals for a results log with no entries."""
+        return {
+            "count": 0,
+            "sum_wpm": 0,
+            "sum_accuracy": 0,
+            "sum_time": 0,
+            "best_wpm": 0,
+            "best_accuracy": 0
+        }
+    
+    def _add_to_stats_totals(self, totals: Dict, result: Dict):
+        """Fold a single result into the running totals."""
+        wpm = result.get("wpm", 0)
+        accuracy = result.get("accuracy", 0)
+        totals["count"] += 1
+        totals["sum_wpm"] += wpm
+        totals["sum_accuracy"] += accuracy
+        totals["sum_time"] += result.get("duration", 0)
+        totals["best_wpm"] = max(totals["best_wpm"], wpm)
+        totals["best_accuracy"] = max(totals["best_accuracy"], accuracy)
+    
+    def _rebuild_stats_cache(self) -> Dict:
+        """Recompute the running totals with a single pass over the results log."""
+        totals = self._empty_stats_totals()
+        for r in self.get_results():
+            self._add_to_stats_totals(totals, r)
+        self._save_json(self.stats_cache_file, totals)
+        self._stats_cache = None
+        return totals
+    
+    def _load_stats_totals(self) -> Dict:
+        """Get the running totals, rebuilding them from the results log if the file is unreadable."""
+        totals = self._load_json_cached(self.stats_cache_file)
+        if "count" not in totals:
+            # The results log is the source of truth, the totals are derived
+            totals = self._rebuild_stats_cache()
+        return totals
     
     def get_statistics(self) -> Dict:
-        """Calculate statistics from all results."""
-        results = self.get_results()
+        """Get statistics from the running totals of all results (kept until the next save_result)."""
+        if self._stats_cache is None:
+            self._stats_cache = self._compute_statistics()
+        return self._stats_cache
+    
+    def _compute_statistics(self) -> Dict:
+        """Build the statistics summary from the running totals file."""
+        totals = self._load_stats_totals()
+        count = totals["count"]
         
-        if not results:
-            return {
+        if not count:
+            stats = {
                 "total_tests": 0,
                 "average_wpm": 0,
                 "average_accuracy": 0,
@@ -240,29 +435,32 @@ class DataManager:
                 "best_accuracy": 0,
                 "total_time": 0
             }
+        else:
+            stats = {
+                "total_tests": count,
+                "average_wpm": round(totals["sum_wpm"] / count, 1),
+                "average_accuracy": round(totals["sum_accuracy"] / count, 1),
+                "best_wpm": totals["best_wpm"],
+                "best_accuracy": totals["best_accuracy"],
+                "total_time": totals["sum_time"]
+            }
         
-        total_wpm = sum(r.get("wpm", 0) for r in results)
-        total_accuracy = sum(r.get("accuracy", 0) for r in results)
-        total_time = sum(r.get("duration", 0) for r in results)
-        
-        return {
-            "total_tests": len(results),
-            "average_wpm": round(total_wpm / len(results), 1),
-            "average_accuracy": round(total_accuracy / len(results), 1),
-            "best_wpm": max(r.get("wpm", 0) for r in results),
-            "best_accuracy": max(r.get("accuracy", 0) for r in results),
-            "total_time": total_time
-        }
+        # Formatted once here rather than by every screen that shows them
+        stats["wpm_display"] = f"{stats['average_wpm']} WPM"
+        stats["accuracy_display"] = f"{stats['average_accuracy']}%"
+        return stats
 
     # Quran Management
+    @functools.cached_property
+    def _quran_raw_by_id(self) -> Dict[int, Dict]:
+        """Raw surah data indexed by surah id, built once (the Quran file never changes)."""
+        data = self._safe_load(self.quran_raw_file)
+        return {s["id"]: s for s in data} if data else {}
+    
     def get_surah_list(self) -> List[Dict]:
         """Get the list of surahs from the raw data."""
-        data = self._load_json(self.quran_raw_file)
-        if not data:
-            return []
-        
         surahs = []
-        for s in data:
+        for s in self._quran_raw_by_id.values():
             surahs.append({
                 "id": s["id"],
                 "name": s["name"],
@@ -272,35 +470,15 @@ class DataManager:
 
     def clean_quran_text(self, text: str) -> str:
         """Clean Quranic text: remove all diacritics, Quranic marks, numbers, and brackets."""
-        # Normalize Alef Wasla to plain Alef
-        text = text.replace('\u0671', '\u0627')
-        
-        # Remove Arabic diacritics (Harakat, Shadda, etc.)
-        # Range covers standard diacritics and Quranic small marks
-        # \u0610-\u061A: Quranic small marks
-        # \u064B-\u065F: Harakat, Shadda, Sukun, Maddah, Hamza above/below
-        # \u0670: Superscript Alef
-        # \u06D6-\u06ED: Quranic pause and start/stop signs
-        text = re.sub(r'[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED]', '', text)
-        
-        # Remove special characters like Sajda symbol ۞ and others not caught by range
-        text = re.sub(r'[۞۩]', '', text)
-        
-        # Remove brackets, numbers, and punctuation common in some datasets
-        text = re.sub(r'[0-9\(\)\[\]\{\}«»\.,;!؟?]', '', text)
+        # Normalize Alef Wasla to plain Alef, then strip marks in one pass
+        text = _QURAN_STRIP_RE.sub('', text.replace('\u0671', '\u0627'))
         
         # Remove redundant spaces and normalize
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return " ".join(text.split())
 
     def get_surah_full_text(self, surah_id: int) -> str:
         """Get the full cleaned text of a surah."""
-        data = self._load_json(self.quran_raw_file)
-        if not data:
-            return ""
-        
-        surah = next((s for s in data if s["id"] == surah_id), None)
+        surah = self._quran_raw_by_id.get(surah_id)
         if not surah:
             return ""
         
@@ -343,12 +521,16 @@ class DataManager:
 
     def save_quran_progress(self, surah_id: int, char_index: int):
         """Save the last reached position in the Quran."""
-        self._save_json(self.quran_progress_file, {
+        progress = {
             "surah_id": surah_id, 
             "char_index": char_index,
             "updated_at": datetime.now().isoformat()
-        })
+        }
+        self._save_json(self.quran_progress_file, progress)
+        self._progress_cache = progress
 
     def get_quran_progress(self) -> Dict:
-        """Get the saved Quran progress."""
-        return self._load_json(self.quran_progress_file)
+        """Get the saved Quran progress (kept in memory until the next save_quran_progress)."""
+        if self._progress_cache is None:
+            self._progress_cache = self._load_json_cached(self.quran_progress_file)
+        return self._progress_cache
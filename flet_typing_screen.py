@@ -2,12 +2,51 @@
 import flet as ft
 from typing import Callable, Dict
 
+# Text styles shared by every span of the same kind
+_STYLE_GREEN = ft.TextStyle(color="green")
+_STYLE_RED = ft.TextStyle(color="red", bgcolor="red100")
+_STYLE_CURSOR = ft.TextStyle(bgcolor="grey700", color="white")
+_STYLE_PENDING = ft.TextStyle(color="grey")
+_STYLE_PENDING_WORD = ft.TextStyle(color="grey700")
+
 class TypingTestScreen(ft.Column):
     def __init__(self, text: str, language: str, on_event: Callable):
         super().__init__()
         self.text = text
         self.language = language
         self.on_event = on_event
+        self._is_arabic = language == "arabic"
+        
+        # Target words never change during a test, split them once
+        self._words = text.split()
+        self._word_count = len(self._words)
+        
+        # Completed and pending words always render the same way, so build
+        # their spans once. Flet diffs children by identity, hence one space
+        # span per gap rather than a single shared one.
+        # Both flat lists lay word i out as [space_i, word_i] (no space before
+        # the first word), so word i starts at span index max(0, 2 * i - 1).
+        self._space_spans = [ft.TextSpan(" ") for _ in self._words]
+        self._completed_flat = []
+        self._pending_flat = []
+        for i, w in enumerate(self._words):
+            if i > 0:
+                self._completed_flat.append(self._space_spans[i])
+                self._pending_flat.append(self._space_spans[i])
+            self._completed_flat.append(ft.TextSpan(w, _STYLE_GREEN))
+            self._pending_flat.append(ft.TextSpan(w, _STYLE_PENDING_WORD))
+        # Span list handed to text_display, refilled in place on every render
+        self._span_buf = []
+        
+        # Hidden field value as of the last processed change
+        self._last_input = ""
+        
+        # Last rendered values, so unchanged frames skip the round-trip to Flet
+        self._last_stats = {}
+        self._last_span_key = (0, "")
+        self._border_color = "outlineVariant"
+        self._border_dirty = False
+        self._test_complete = False
         
         self.spacing = 10
         self.horizontal_alignment = ft.CrossAxisAlignment.CENTER
@@ -16,8 +55,8 @@ class TypingTestScreen(ft.Column):
             spans=[], 
             size=24, 
             weight=ft.FontWeight.W_500,
-            font_family="Arial" if language == "arabic" else "Roboto Mono",
-            text_align=ft.TextAlign.RIGHT if language == "arabic" else ft.TextAlign.LEFT
+            font_family="Arial" if self._is_arabic else "Roboto Mono",
+            text_align=ft.TextAlign.RIGHT if self._is_arabic else ft.TextAlign.LEFT
         )
         
         # Stats controls
@@ -79,7 +118,7 @@ class TypingTestScreen(ft.Column):
                 border_radius=15,
                 border=ft.border.all(2, "outlineVariant"),
                 width=900,
-                alignment=ft.alignment.top_right if self.language == "arabic" else ft.alignment.top_left,
+                alignment=ft.alignment.top_right if self._is_arabic else ft.alignment.top_left,
                 on_click=lambda e: self.focus_input()
             ),
             
@@ -109,8 +148,9 @@ class TypingTestScreen(ft.Column):
     def focus_input(self):
         if self.hidden_input_ref.current:
             self.hidden_input_ref.current.focus()
-            self.text_display.parent.border = ft.border.all(2, "blue")
+            self._set_border("blue")
             self.text_display.parent.update()
+            self._border_dirty = False
 
     def _stat_box(self, label, control):
         return ft.Column(
@@ -131,134 +171,95 @@ class TypingTestScreen(ft.Column):
         pass
 
     def handle_input_change(self, e):
-        # Determine the change (this is a bit tricky with on_change as it gives full value)
-        # But for typing test we can just clear it after reading?
-        # Or keeping it to support backspace?
-        # ISSUE: If we clear it, Mobile/IME might struggle.
-        # Better strategy: Compare current value with previous known value?
-        # Simplified strategy: 
-        # For every character typed, we get the whole string. 
-        # But we only want the *last* action.
-        # Actually simplest for typing test: 
-        # Just clear the text field after processing the last char? 
-        # But that breaks Arabic composition.
-        # So we keep the text in the field, and we check the *difference*.
-        
-        current_val = e.control.value
-        if not current_val:
-            return
-            
-        # Get the new character(s)
-        # This is a basic implementation assuming 1 char at a time usually
-        # For backspace, the length will decrease.
-        
-        last_char = current_val[-1]
-        
-        # Handle "Space" specifically if needed, but in TextField ' ' is just ' '
-        
-        # We need to detect Backspace. 
-        # Flet TextField doesn't easily convert Backspace to a character event here, 
-        # but the string length shrinks.
-        # However, we don't have previous state easily here without storing it in class.
-        # Let's rely on storing `self.last_input_len`.
-        
-        # WAIT: The simplest way that works for most is to just clear it?
-        # No, Arabic connected letters depend on history.
-        
-        # Let's try this: 
-        # Rely on the fact that we process one char at a time.
-        # Actually, handling Backspace via on_change is hard (detection of deletion).
-        # We might need `on_keyboard_event` for control keys (Backspace) 
-        # and `on_change` (or `on_submit`?) for text.
-        # Combined approach:
-        # 1. Listen to `on_change` for characters.
-        # 2. Listen to `on_keyboard_event` ONLY for Backspace?
-        #    But `on_keyboard_event` on Page captures everything.
-        
-        # Let's look at the logs again: Backspace WAS detected correctly in `on_keyboard_event`.
-        # The problem was just the characters.
-        # So: Use `on_keyboard_event` for Backspace.
-        # Use `TextField` for Characters?
-        # But TextField also consumes the key press, so `on_keyboard_event` might fire too?
+        # The hidden field keeps everything typed (clearing it breaks Arabic/IME
+        # composition), so each change is diffed against the previous value:
+        # removed characters are backspaces, appended ones are keystrokes.
+        current_val = e.control.value or ""
+        previous = self._last_input
         
-        # Strategy:
-        # Use a TextField. 
-        # In its `on_change`: take the last character, process it, then CLEAR the text field?
-        # If I clear it, Arabic simple typing usually works fine (connecting letters might flicker but usually logic handles it).
-        # Ligatures are visual. If I type 'l' then 'a', I get 'la'. 
-        # If I clear 'l' then type 'a', I get 'a'.
-        # This breaks visual composition in the input field, but we are displaying the text in OUR custom display.
-        # Our custom display handles the full string logic.
-        # The input field is hidden anyway!
-        # So clearing it is fine! 
-        # EXCEPT for Android/Mobile keyboards which might get confused if field is cleared.
-        # But on Desktop Windows, clearing should be fine.
+        if current_val.startswith(previous):
+            common = len(previous)
+        elif previous.startswith(current_val):
+            common = len(current_val)
+        else:
+            # Text was replaced in the middle (e.g. by an IME), diff by hand
+            common = 0
+            limit = min(len(current_val), len(previous))
+            while common < limit and current_val[common] == previous[common]:
+                common += 1
         
-        # Let's try: 
-        # 1. Get char.
-        # 2. Process.
-        # 3. Clear text field.
+        self._test_complete = False
+        for _ in range(len(previous) - common):
+            self.process_input({"char": "", "is_backspace": True})
         
-        # What about Backspace? `on_change` doesn't fire for backspace if empty?
-        # We need `on_keyboard_event` on the TextField? Flet TextField doesn't export that directly?
-        # We can use `on_submit`? No.
+        accepted = [previous[:common]]
+        for char in current_val[common:]:
+            if self._test_complete:
+                break
+            if self.process_input({"char": char, "is_backspace": False}):
+                accepted.append(char)
+        self._last_input = "".join(accepted)
         
-        # We can use the Page's keyboard event for Backspace (it works global).
-        # And use TextField for characters.
+        # Drop rejected characters so later backspaces stay in sync with the test
+        rejected = self._last_input != current_val
+        if rejected:
+            e.control.value = self._last_input
         
-        # So:
-        # global handle_keystroke:
-        #   if key == "Backspace": process backspace.
-        #   else: ignore (let TextField handle it).
+        # One update for the whole change, however many characters it carried
+        self.update_display(force=rejected)
         
-        # TextField on_change:
-        #   char = value
-        #   process char
-        #   value = ""
+        if self._test_complete:
+            self.on_event("finish", None)
+
+    def process_input(self, data) -> bool:
+        # Feeds one keystroke to the test and returns whether it was accepted;
+        # rendering is left to the caller so a burst of input costs one update
+        result = self.on_event("keystroke", data)
+        if not result:
+            return True
         
-        new_char = current_val[-1]
-        data = {"char": new_char, "is_backspace": False}
-        self.process_input(data)
+        if not result.get("accepted", True) or result.get("error", False):
+            self._set_border("red")
+        else:
+            self._set_border("blue") # Keep blue focus
         
-        e.control.value = ""
-        e.control.update()
+        if result.get("test_complete", False):
+            self._test_complete = True
+        return result.get("accepted", True)
 
-    def handle_global_key(self, e: ft.KeyboardEvent):
-        if e.key == "Backspace":
-             self.process_input({"char": "", "is_backspace": True})
-
-    def process_input(self, data):
-        result = self.on_event("keystroke", data)
-        if result:
-            if not result.get("accepted", True) or result.get("error", False):
-                self.text_display.parent.border = ft.border.all(2, "red")
-                self.text_display.parent.update()
-            else:
-                self.text_display.parent.border = ft.border.all(2, "blue") # Keep blue focus
-            
-            self.update_display()
-            
-            if result.get("test_complete", False):
-                self.on_event("finish", None)
-                
-    # Retain old handle_keystroke just in case but rename or delete
-    # We need to register handle_global_key instead of handle_keystroke in main.py? 
-    # Or just call it handle_keystroke and change logic.
-    
-    def handle_keystroke(self, e: ft.KeyboardEvent):
-        # We only care about Backspace here now
-        if e.key == "Backspace":
-             self.process_input({"char": "", "is_backspace": True})
-        # Ignore other keys, let Hidden TextField handle them
+    def _set_border(self, color):
+        if color != self._border_color:
+            self._border_color = color
+            self.text_display.parent.border = ft.border.all(2, color)
+            self._border_dirty = True
 
-    def update_display(self):
+    def update_display(self, force: bool = False):
         stats = self.on_event("update", None)
-        if stats:
+        if not stats:
+            return
+        
+        dirty = force or self._border_dirty
+        self._border_dirty = False
+        
+        # Spans only depend on word progress and the current word's input
+        span_key = (stats.get("words_completed", 0), stats.get("current_word_input", ""))
+        if span_key != self._last_span_key:
+            self._last_span_key = span_key
             self.update_text_display(stats)
-            self.time_text.value = f"{stats['elapsed_time']}s"
-            self.wpm_text.value = f"{stats['current_wpm']}"
-            self.acc_text.value = f"{stats['current_accuracy']}%"
-            self.error_text.value = f"{stats['errors']}"
+            dirty = True
+        
+        for name, control, value in (
+            ("time", self.time_text, f"{stats['elapsed_time']}s"),
+            ("wpm", self.wpm_text, f"{stats['current_wpm']}"),
+            ("accuracy", self.acc_text, f"{stats['current_accuracy']}%"),
+            ("errors", self.error_text, f"{stats['errors']}"),
+        ):
+            if self._last_stats.get(name) != value:
+                self._last_stats[name] = value
+                control.value = value
+                dirty = True
+        
+        if dirty:
             self.update()
 
     def update_text_display(self, stats: Dict):
@@ -266,40 +267,44 @@ class TypingTestScreen(ft.Column):
         # Assuming run via update_display which calls self.update()
         
     def _generate_spans(self, stats: Dict):
-        words = self.text.split()
         completed_count = stats.get("words_completed", 0)
         current_input = stats.get("current_word_input", "")
         
-        # Build spans
-        spans = []
+        # Build spans (Flet keeps its own copy of the previous children for diffing)
+        spans = self._span_buf
+        spans.clear()
         
-        for i, word in enumerate(words):
-            # Space between words
-            if i > 0:
-                spans.append(ft.TextSpan(" "))
+        # Completed words, with the spaces between them
+        spans.extend(self._completed_flat[:max(0, 2 * completed_count - 1)])
+        
+        if completed_count < self._word_count:
+            word = self._words[completed_count]
+            # Space before the current word
+            if completed_count > 0:
+                spans.append(self._space_spans[completed_count])
+            
+            # Current Word (Partial coloring)
+            # Correct prefix as a single span
+            input_len = min(len(current_input), len(word))
+            correct_len = 0
+            while correct_len < input_len and current_input[correct_len] == word[correct_len]:
+                correct_len += 1
+            if correct_len:
+                spans.append(ft.TextSpan(word[:correct_len], _STYLE_GREEN))
+            
+            # Typed characters after the first mistake, checked one by one
+            for j in range(correct_len, input_len):
+                char = word[j]
+                style = _STYLE_GREEN if current_input[j] == char else _STYLE_RED
+                spans.append(ft.TextSpan(char, style))
             
-            if i < completed_count:
-                # Completed Word
-                spans.append(ft.TextSpan(word, ft.TextStyle(color="green")))
+            if input_len < len(word):
+                # Current character cursor
+                spans.append(ft.TextSpan(word[input_len], _STYLE_CURSOR))
+                # Pending characters
+                if input_len + 1 < len(word):
+                    spans.append(ft.TextSpan(word[input_len + 1:], _STYLE_PENDING))
             
-            elif i == completed_count:
-                # Current Word (Partial coloring)
-                # Correct part
-                correct_len = 0
-                for j, char in enumerate(word):
-                    if j < len(current_input):
-                        if current_input[j] == char:
-                           spans.append(ft.TextSpan(char, ft.TextStyle(color="green", bgcolor=None)))
-                        else:
-                           spans.append(ft.TextSpan(char, ft.TextStyle(color="red", bgcolor="red100")))
-                    else:
-                        if j == len(current_input):
-                            # Current character cursor
-                            spans.append(ft.TextSpan(char, ft.TextStyle(bgcolor="grey700", color="white")))
-                        else:
-                            # Pending characters
-                             spans.append(ft.TextSpan(char, ft.TextStyle(color="grey")))
-            else:
-                # Pending Word
-                spans.append(ft.TextSpan(word, ft.TextStyle(color="grey700")))
+            # Pending words, each with its leading space
+            spans.extend(self._pending_flat[2 * completed_count + 1:])
         return spans
@@ -2,7 +2,7 @@
 import flet as ft
 from data_manager import DataManager
 from typing_test import TypingTest
-from ui_components import WelcomeScreen, MainMenu, ResultsScreen, StatisticsScreen, SettingsScreen, ManageTextsScreen
+from ui_components import WelcomeScreen, MainMenu, ResultsScreen, StatisticsScreen, SettingsScreen, ManageTextsScreen, LazyListView
 from flet_typing_screen import TypingTestScreen
 import random
 
@@ -25,19 +25,34 @@ def main(page: ft.Page):
         "current_test": None,
         "current_text": None,
         "quran_info": None, # Optional: {surah_id: int, char_start: int}
+        # The main menu stays mounted (hidden) while other screens are shown,
+        # and is only rebuilt when the data it displays changes
+        "menu": None,
+        "menu_key": None,
+        # Same for the statistics screen, rebuilt only when the statistics change
+        "stats_screen": None,
+        "stats_screen_key": None,
     }
 
     # Navigation Methods
+    def show_screen(screen):
+        """Show a screen in place of the current one, keeping the menu mounted."""
+        menu = state["menu"]
+        if menu is not None:
+            menu.visible = False
+            page.controls = [menu, screen]
+        else:
+            page.controls = [screen]
+        page.update()
+
     def show_welcome():
-        page.clean()
-        page.add(WelcomeScreen(on_complete=on_welcome_complete))
+        show_screen(WelcomeScreen(on_complete=on_welcome_complete))
 
     def on_welcome_complete(username, language):
         user = data_manager.create_user(username, language)
         state["user"] = user
         show_menu()
     def show_menu():
-        page.clean()
         # Unsubscribe from keyboard events just in case
         page.on_keyboard_event = None
         
@@ -47,15 +62,22 @@ def main(page: ft.Page):
         progress = data_manager.get_quran_progress()
         has_progress = progress and progress.get("char_index", 0) > 0
         
-        page.add(MainMenu(
-            user_data=user,
-            stats=stats,
-            on_start_test=lambda: show_text_selection(),
-            on_manage_texts=lambda: show_manage_texts(),
-            on_view_stats=lambda: show_stats(),
-            on_settings=lambda: show_settings(),
-            on_resume_quran=lambda: resume_quran() if has_progress else None
-        ))
+        menu_key = (user, stats, has_progress)
+        if state["menu"] is None or menu_key != state["menu_key"]:
+            state["menu"] = MainMenu(
+                user_data=user,
+                stats=stats,
+                on_start_test=lambda: show_text_selection(),
+                on_manage_texts=lambda: show_manage_texts(),
+                on_view_stats=lambda: show_stats(),
+                on_settings=lambda: show_settings(),
+                on_resume_quran=lambda: resume_quran() if has_progress else None
+            )
+            state["menu_key"] = menu_key
+        
+        state["menu"].visible = True
+        page.controls = [state["menu"]]
+        page.update()
 
     def resume_quran():
         progress = data_manager.get_quran_progress()
@@ -149,61 +171,69 @@ def main(page: ft.Page):
             # Since my logic is char-based, I'll provide an option to start from an Ayah by looking up its offset.
             show_ayah_selection(surah_id)
 
-        surah_buttons = [
-            ft.ListTile(
+        # One handler for every tile, each tile carries its surah id in data
+        def on_surah_click(e):
+            on_surah_select(e.control.data)
+
+        def surah_button(i):
+            s = surahs[i]
+            return ft.ListTile(
                 title=ft.Text(f"{s['id']}. {s['name']}"),
-                on_click=lambda e, sid=s["id"]: on_surah_select(sid)
-            ) for s in surahs
-        ]
+                data=s["id"],
+                on_click=on_surah_click
+            )
 
         dialog = ft.AlertDialog(
             title=ft.Text("اختر السورة / Select Surah"),
             content=ft.Container(
-                content=ft.ListView(controls=surah_buttons, height=400),
+                content=LazyListView(len(surahs), surah_button, height=400),
                 width=300
             )
         )
         page.open(dialog)
 
     def show_ayah_selection(surah_id):
-        raw_data = data_manager._load_json(data_manager.quran_raw_file)
-        surah = next(s for s in raw_data if s["id"] == surah_id)
+        surah = data_manager._quran_raw_by_id[surah_id]
+        
+        # Char offset of each ayah in the cleaned surah text: the cleaned
+        # lengths of the ayahs before it, plus 1 for each joining space
+        ayah_offsets = []
+        offset = 0
+        for v in surah["verses"]:
+            ayah_offsets.append(offset)
+            cleaned = data_manager.clean_quran_text(v["text"])
+            if cleaned:
+                offset += len(cleaned) + 1
         
         def start_from_ayah(ayah_index):
             page.close(dialog)
-            # Calculate char offset
-            full_text_before = " ".join([surah["verses"][i]["text"] for i in range(ayah_index)])
-            # Clean it to get accurate offset
-            cleaned_before = data_manager.clean_quran_text(full_text_before)
-            
-            if ayah_index == 0:
-                offset = 0
-            else:
-                # Add 1 for the space that was used in joining if there was text before
-                offset = len(cleaned_before) + 1
-            
-            start_quran_test(surah_id, offset)
+            start_quran_test(surah_id, ayah_offsets[ayah_index])
 
-        ayah_buttons = [
-            ft.ListTile(
+        verses = surah["verses"]
+        
+        # One handler for every tile, each tile carries its ayah index in data
+        def on_ayah_click(e):
+            start_from_ayah(e.control.data)
+        
+        def ayah_button(i):
+            v = verses[i]
+            return ft.ListTile(
                 title=ft.Text(f"آية {v['id']}"),
                 subtitle=ft.Text(v["text"][:30] + "...", size=12),
-                on_click=lambda e, idx=i: start_from_ayah(idx)
-            ) for i, v in enumerate(surah["verses"])
-        ]
+                data=i,
+                on_click=on_ayah_click
+            )
 
         dialog = ft.AlertDialog(
             title=ft.Text(f"اختر بداية الكتابة - {surah['name']}"),
             content=ft.Container(
-                content=ft.ListView(controls=ayah_buttons, height=400),
+                content=LazyListView(len(verses), ayah_button, height=400),
                 width=300
             )
         )
         page.open(dialog)
 
     def show_typing_screen():
-        page.clean()
-        
         # Wrap screen in container
         lang = state["user"].get("language", "english")
         text = state["current_text"]["text"]
@@ -228,20 +258,17 @@ def main(page: ft.Page):
                     data_manager.save_quran_progress(q_info["surah_id"], q_info["char_start"] + len(text) + 1)
                 show_results()
             elif event_type == "restart":
-                # reset test
-                state["current_test"] = TypingTest(text)
+                # reset test, keeping the words already split from the text
+                test.reset()
                 show_typing_screen()
             elif event_type == "home":
                 state["quran_info"] = None # Clear quran context on home
                 show_menu()
         
-        screen = TypingTestScreen(text, lang, on_event)
-        page.add(screen)
-        
-        # Bind global keyboard event to screen handler
-        print("DEBUG: Binding keyboard event")
-        page.on_keyboard_event = screen.handle_keystroke
-        page.update()
+        # All typing goes through the screen's hidden field; drop any
+        # page-level handler left over from the results screen
+        page.on_keyboard_event = None
+        show_screen(TypingTestScreen(text, lang, on_event))
         
     def show_results():
         page.on_keyboard_event = None # Stop listening
@@ -268,7 +295,6 @@ def main(page: ft.Page):
 
     def show_results():
         page.on_keyboard_event = None # Stop listening
-        page.clean()
         
         results = state["current_test"].calculate_scores()
         
@@ -277,7 +303,7 @@ def main(page: ft.Page):
             "language": state["user"].get("language", "english"),
             "text_id": state["current_text"]["id"],
             "difficulty": state["current_text"].get("difficulty", "intermediate"),
-            **results
+            **results._asdict()
         }
         data_manager.save_result(raw_result)
         
@@ -299,40 +325,39 @@ def main(page: ft.Page):
         
         page.on_keyboard_event = handle_results_key
 
-        page.add(ResultsScreen(
-            results,
+        show_screen(ResultsScreen(
+            raw_result,
             on_retry=lambda: restart_test(), # Direct restart
             on_home=lambda: show_menu(),
             on_next=on_next
         ))
-        page.update()
 
     # Placeholder pages
     # Placeholder pages
     def show_manage_texts():
-        page.clean()
-        page.add(ManageTextsScreen(
+        show_screen(ManageTextsScreen(
             data_manager=data_manager,
             on_back=lambda: show_menu()
         ))
         
     def show_stats():
-        page.clean()
         stats = data_manager.get_statistics()
-        page.add(StatisticsScreen(
-            stats=stats,
-            on_back=lambda: show_menu()
-        ))
+        if state["stats_screen"] is None or stats != state["stats_screen_key"]:
+            state["stats_screen"] = StatisticsScreen(
+                stats=stats,
+                on_back=lambda: show_menu()
+            )
+            state["stats_screen_key"] = stats
+        show_screen(state["stats_screen"])
         
     def show_settings():
-        page.clean()
         current_theme = "dark" if page.theme_mode == ft.ThemeMode.DARK else "light"
         
         def change_theme(mode):
             page.theme_mode = ft.ThemeMode.DARK if mode == "dark" else ft.ThemeMode.LIGHT
             page.update()
             
-        page.add(SettingsScreen(
+        show_screen(SettingsScreen(
             current_theme_mode=current_theme,
             on_change_theme=change_theme,
             on_back=lambda: show_menu()
@@ -346,4 +371,6 @@ def main(page: ft.Page):
         show_welcome()
 
 if __name__ == "__main__":
-    ft.app(target=main)
+    # CanvasKit draws the whole page on one canvas, which keeps per-keystroke
+    # span updates cheap when the app is served to a browser
+    ft.app(target=main, web_renderer=ft.WebRenderer.CANVAS_KIT)
@@ -4,16 +4,114 @@ Core logic for typing tests including WPM, accuracy, and score calculations.
 Monkeytype-style implementation with word-by-word validation and accurate error tracking.
 """
 
-import time
-from typing import Dict, List
+import heapq
+import operator
+from array import array
+from collections import defaultdict
+from time import monotonic
+from typing import Dict, List, NamedTuple, Tuple
+
+
+# (correct / 5) / (seconds / 60) folded into one multiplier
+_WPM_PER_CHAR_SECOND = 60 / 5
+
+
+def _wpm(correct: int, seconds: float) -> float:
+    """Words per minute from correct characters (5 characters = 1 word)."""
+    if seconds <= 0:
+        return 0
+    return round(correct * _WPM_PER_CHAR_SECOND / seconds, 1)
+
+
+def _accuracy(correct: int, total: int) -> float:
+    """Percentage of keystrokes that were correct."""
+    if total == 0:
+        return 100.0
+    return round(correct / total * 100, 1)
+
+
+def _scores(correct: int, total: int, duration: float) -> Tuple[float, float, int, int, int]:
+    """Compute (wpm, accuracy, speed_score, accuracy_score, overall_score) from raw counters."""
+    wpm = _wpm(correct, duration)
+    accuracy = _accuracy(correct, total)
+    
+    # Speed score: Based on WPM (100 WPM = 100 score)
+    speed_score = min(100, round(wpm))
+    
+    # Accuracy score: Direct percentage
+    accuracy_score = round(accuracy)
+    
+    # Overall score: Average of speed and accuracy
+    overall_score = round((speed_score + accuracy_score) / 2)
+    
+    return wpm, accuracy, speed_score, accuracy_score, overall_score
+
+
+class TestScores(NamedTuple):
+    """Final results of a test, as returned by TypingTest.calculate_scores."""
+    wpm: float
+    accuracy: float
+    speed_score: int
+    accuracy_score: int
+    overall_score: int
+    duration: float
+    total_keystrokes: int
+    correct_keystrokes: int
+    incorrect_keystrokes: int
+    top_missed_keys: List[Tuple[str, int]]
+
+
+# Per-key error counters: ASCII and the Arabic block get flat arrays indexed
+# by codepoint, anything else (rare) falls back to a defaultdict
+_ARABIC_BASE = 0x0600
+_ARABIC_SIZE = 0x100
 
 
 class TypingTest:
     """Manages typing test logic and calculations with Monkeytype-style validation."""
     
+    # Fixed attribute layout: no per-instance __dict__, and faster attribute
+    # access on the keystroke path
+    __slots__ = (
+        "text", "words", "_words_lens",
+        "start_time", "end_time", "user_input",
+        "total_keystrokes", "correct_keystrokes", "incorrect_keystrokes",
+        "current_word_index", "_current_word", "_current_word_len", "_complete",
+        "_buf", "_current_word_input_len", "_typed_ok", "_mismatches",
+        "completed_words", "_completed_prefix",
+        "_err_ascii", "_err_arabic", "_err_other", "_err_order",
+        "_stats_cache", "_stats_cache_key",
+    )
+    
     def __init__(self, text: str):
         self.text = text
         self.words = text.split()  # Split into words
+        self._words_lens = [len(w) for w in self.words]
+        
+        # The typed characters of the current word live in a buffer sized for
+        # the longest word and only the first _current_word_input_len are live.
+        # Whether each live buffer slot matches the target is kept alongside,
+        # so checking the word never has to rebuild and compare strings
+        self._buf = [""] * max(self._words_lens, default=0)
+        self._typed_ok = [False] * len(self._buf)
+        
+        # Track specific key errors
+        self._err_ascii = array('I', bytes(4 * 128))
+        self._err_arabic = array('I', bytes(4 * _ARABIC_SIZE))
+        self._err_other = defaultdict(int)
+        # Codepoints in the order they were first missed, so ties rank as before
+        self._err_order = []
+        
+        # Track completed words
+        self.completed_words = []
+        
+        self.reset()
+    
+    def reset(self):
+        """Clear all progress so the same text can be typed again.
+        
+        The words and buffers derived from the text are kept as they are.
+        """
         self.start_time = None
         self.end_time = None
         self.user_input = ""
@@ -25,28 +123,56 @@ class TypingTest:
         
         # Track current word progress
         self.current_word_index = 0
-        self.current_word_input = ""
+        self._current_word_input_len = 0
+        self._mismatches = 0
+        self._advance_word()
         
-        # Track completed words
-        self.completed_words = []
+        self.completed_words.clear()
+        # Completed words joined with a trailing space each, for get_full_typed_text
+        self._completed_prefix = ""
         
-        # Track specific key errors
-        self.key_errors = {}
+        # Only the slots of keys that were missed can be non-zero
+        for cp in self._err_order:
+            counts, i = self._err_slot(cp)
+            counts[i] = 0
+        self._err_other.clear()
+        self._err_order.clear()
+        
+        # Last get_current_stats result and the state it was computed from
+        self._stats_cache = None
+        self._stats_cache_key = None
         
     def start(self):
         """Start the typing test timer."""
-        self.start_time = time.time()
+        # Monotonic clock: durations stay right if the wall clock is adjusted mid-test
+        self.start_time = monotonic()
     
     def finish(self):
         """Finish the typing test timer."""
-        self.end_time = time.time()
+        self.end_time = monotonic()
     
     def get_duration(self) -> float:
         """Get test duration in seconds."""
-        if self.start_time and self.end_time:
+        if self.start_time is not None and self.end_time is not None:
             return self.end_time - self.start_time
         return 0
     
+    def _advance_word(self):
+        """Cache the word at current_word_index, its length and whether the test is done."""
+        if self.current_word_index < len(self.words):
+            self._current_word = self.words[self.current_word_index]
+            self._current_word_len = self._words_lens[self.current_word_index]
+            self._complete = False
+        else:
+            self._current_word = ""
+            self._current_word_len = 0
+            self._complete = True
+    
+    @property
+    def current_word_input(self) -> str:
+        """The characters typed so far for the current word."""
+        return "".join(self._buf[:self._current_word_input_len])
+    
     def get_current_word(self) -> str:
         """Get the current word that should be typed."""
         if self.current_word_index < len(self.words):
@@ -55,8 +181,7 @@ class TypingTest:
     
     def is_current_word_correct(self) -> bool:
         """Check if the current word input matches the expected word."""
-        current_word = self.get_current_word()
-        return self.current_word_input == current_word
+        return self._current_word_input_len == self._current_word_len and self._mismatches == 0
     
     def can_add_space(self) -> bool:
         """Check if user can add a space (only if current word is correct)."""
@@ -69,17 +194,25 @@ class TypingTest:
         """
         if is_backspace:
             # Allow backspace
-            if len(self.current_word_input) > 0:
-                self.current_word_input = self.current_word_input[:-1]
+            pos = self._current_word_input_len
+            if pos > 0:
+                pos -= 1
+                self._current_word_input_len = pos
+                if not self._typed_ok[pos]:
+                    self._mismatches -= 1
             return {"accepted": True, "error": False}
         
         # Check if it's a space
         if char == ' ':
-            if self.can_add_space():
+            # Same check as can_add_space(), inlined for the keystroke path
+            if self._current_word_input_len == self._current_word_len and self._mismatches == 0:
                 # Move to next word
-                self.completed_words.append(self.current_word_input)
+                word_input = self.current_word_input
+                self.completed_words.append(word_input)
+                self._completed_prefix += word_input + " "
                 self.current_word_index += 1
-                self.current_word_input = ""
+                self._current_word_input_len = 0
+                self._advance_word()
                 self.total_keystrokes += 1
                 self.correct_keystrokes += 1
                 return {"accepted": True, "error": False}
@@ -88,22 +221,28 @@ class TypingTest:
                 return {"accepted": False, "error": True}
         
         # Regular character
-        current_word = self.get_current_word()
-        current_pos = len(self.current_word_input)
+        current_word = self._current_word
+        current_pos = self._current_word_input_len
         
         # Check if we're still within the word length
-        if current_pos < len(current_word):
+        if current_pos < self._current_word_len:
             is_correct = char == current_word[current_pos]
-            self.current_word_input += char
+            self._buf[current_pos] = char
+            self._typed_ok[current_pos] = is_correct
+            self._current_word_input_len = current_pos + 1
             self.total_keystrokes += 1
             
             if is_correct:
                 self.correct_keystrokes += 1
             else:
                 self.incorrect_keystrokes += 1
+                self._mismatches += 1
                 # Track specific key error (using the expected char)
-                expected_char = current_word[current_pos]
-                self.key_errors[expected_char] = self.key_errors.get(expected_char, 0) + 1
+                cp = ord(current_word[current_pos])
+                counts, i = self._err_slot(cp)
+                if not counts[i]:
+                    self._err_order.append(cp)
+                counts[i] += 1
             
             return {"accepted": True, "error": not is_correct}
         else:
@@ -112,66 +251,52 @@ class TypingTest:
     
     def get_full_typed_text(self) -> str:
         """Get the full text typed so far (completed words + current word)."""
-        if self.completed_words:
-            return ' '.join(self.completed_words) + ' ' + self.current_word_input
-        return self.current_word_input
+        return self._completed_prefix + self.current_word_input
     
     def calculate_wpm(self) -> float:
         """Calculate Words Per Minute (WPM) based on correct characters."""
-        duration = self.get_duration()
-        if duration == 0:
-            return 0
-        
-        # Use correct keystrokes for WPM calculation
-        characters = self.correct_keystrokes
-        words = characters / 5
-        minutes = duration / 60
-        
-        return round(words / minutes, 1) if minutes > 0 else 0
+        return _wpm(self.correct_keystrokes, self.get_duration())
     
     def calculate_accuracy(self) -> float:
         """
         Calculate typing accuracy based on ALL keystrokes (including corrected errors).
         This gives the TRUE accuracy, not the final result accuracy.
         """
-        if self.total_keystrokes == 0:
-            return 100.0
-        
-        accuracy = (self.correct_keystrokes / self.total_keystrokes * 100)
-        return round(accuracy, 1)
+        return _accuracy(self.correct_keystrokes, self.total_keystrokes)
     
-    def calculate_scores(self) -> Dict[str, float]:
+    def calculate_scores(self) -> TestScores:
         """Calculate speed and accuracy scores (1-100 scale)."""
-        wpm = self.calculate_wpm()
-        accuracy = self.calculate_accuracy()
-        
-        # Speed score: Based on WPM (100 WPM = 100 score)
-        speed_score = min(100, round(wpm))
-        
-        # Accuracy score: Direct percentage
-        accuracy_score = round(accuracy)
-        
-        # Overall score: Average of speed and accuracy
-        overall_score = round((speed_score + accuracy_score) / 2)
-        
-        return {
-            "wpm": wpm,
-            "accuracy": accuracy,
-            "speed_score": speed_score,
-            "accuracy_score": accuracy_score,
-            "overall_score": overall_score,
-            "duration": round(self.get_duration(), 1),
-            "total_keystrokes": self.total_keystrokes,
-            "correct_keystrokes": self.correct_keystrokes,
-            "incorrect_keystrokes": self.incorrect_keystrokes,
-            "top_missed_keys": self.get_top_missed_keys()
-        }
+        duration = self.get_duration()
+        return TestScores(
+            *_scores(self.correct_keystrokes, self.total_keystrokes, duration),
+            duration=round(duration, 1),
+            total_keystrokes=self.total_keystrokes,
+            correct_keystrokes=self.correct_keystrokes,
+            incorrect_keystrokes=self.incorrect_keystrokes,
+            top_missed_keys=self.get_top_missed_keys()
+        )
+    
+    def _err_slot(self, cp: int):
+        """Return the (counter, index) pair holding the error count for codepoint cp."""
+        if cp < 128:
+            return self._err_ascii, cp
+        if 0 <= cp - _ARABIC_BASE < _ARABIC_SIZE:
+            return self._err_arabic, cp - _ARABIC_BASE
+        return self._err_other, cp
+    
+    @property
+    def key_errors(self) -> Dict[str, int]:
+        """Error count per expected character, in the order keys were first missed."""
+        errors = {}
+        for cp in self._err_order:
+            counts, i = self._err_slot(cp)
+            errors[chr(cp)] = counts[i]
+        return errors
     
     def get_top_missed_keys(self) -> List[tuple]:
         """Get the top 3 most missed keys."""
-        # Sort by count descending
-        sorted_errors = sorted(self.key_errors.items(), key=lambda x: x[1], reverse=True)
-        return sorted_errors[:3]
+        # Only the top 3 are needed, so skip sorting every missed key
+        return heapq.nlargest(3, self.key_errors.items(), key=operator.itemgetter(1))
 
     def get_errors_count(self) -> int:
         """Get total number of incorrect keystrokes."""
@@ -179,7 +304,7 @@ class TypingTest:
     
     def get_current_stats(self) -> Dict:
         """Get current statistics during the test."""
-        if not self.start_time:
+        if self.start_time is None:
             return {
                 "elapsed_time": 0,
                 "current_wpm": 0,
@@ -191,21 +316,20 @@ class TypingTest:
                 "total_words": len(self.words)
             }
         
-        elapsed = time.time() - self.start_time
+        elapsed = monotonic() - self.start_time
+        
+        # Reuse the last result until a keystroke lands or the next half second starts
+        key = (self.total_keystrokes, self.current_word_index, self._current_word_input_len, int(elapsed * 2))
+        if key == self._stats_cache_key:
+            return self._stats_cache
         
         # Calculate current WPM based on correct keystrokes
-        if elapsed > 0:
-            characters = self.correct_keystrokes
-            words = characters / 5
-            minutes = elapsed / 60
-            current_wpm = round(words / minutes, 1) if minutes > 0 else 0
-        else:
-            current_wpm = 0
+        current_wpm = _wpm(self.correct_keystrokes, elapsed)
         
         # Calculate current accuracy
-        current_accuracy = self.calculate_accuracy()
+        current_accuracy = _accuracy(self.correct_keystrokes, self.total_keystrokes)
         
-        return {
+        self._stats_cache = {
             "elapsed_time": round(elapsed, 1),
             "current_wpm": current_wpm,
             "current_accuracy": current_accuracy,
@@ -215,7 +339,9 @@ class TypingTest:
             "words_completed": len(self.completed_words),
             "total_words": len(self.words)
         }
+        self._stats_cache_key = key
+        return self._stats_cache
     
     def is_test_complete(self) -> bool:
         """Check if the test is complete (all words typed correctly)."""
-        return self.current_word_index >= len(self.words)
+        return self._complete
@@ -3,11 +3,31 @@ Flet UI Components
 Reimplementation of UI screens using Flet framework.
 """
 
+import functools
 import flet as ft
 from typing import Callable, Dict, List, Optional
-import time
+
+# Enum values used by nearly every screen, resolved once
+_BOLD = ft.FontWeight.BOLD
+_MAIN_CENTER = ft.MainAxisAlignment.CENTER
+_CROSS_CENTER = ft.CrossAxisAlignment.CENTER
+_DEFAULT_STATE = ft.ControlState.DEFAULT
+_TEXT_CENTER = ft.TextAlign.CENTER
+
+# Overall score colour indexed by score 0..100 (green from 70 up)
+_SCORE_COLORS = ("orange",) * 70 + ("green",) * 31
+
+# Button styles are plain values, so one instance can back every button that
+# uses it, as long as those buttons don't also pass color/bgcolor/elevation
+# (ElevatedButton writes those into its style)
+_START_BUTTON_STYLE = ft.ButtonStyle(
+    bgcolor={_DEFAULT_STATE: "green"},
+    color={_DEFAULT_STATE: "white"},
+)
 
 class WelcomeScreen(ft.Column):
+    __slots__ = ("on_complete", "username_field", "language_dropdown")
+
     def __init__(self, on_complete: Callable[[str, str], None]):
         super().__init__()
         self.on_complete = on_complete
@@ -26,37 +46,43 @@ class WelcomeScreen(ft.Column):
             value="arabic"
         )
         
-        self.horizontal_alignment = ft.CrossAxisAlignment.CENTER
-        self.alignment = ft.MainAxisAlignment.CENTER
+        self.horizontal_alignment = _CROSS_CENTER
+        self.alignment = _MAIN_CENTER
         self.spacing = 20
         
         self.controls = [
-            ft.Text("مرحباً بك في مدرب الكتابة", size=30, weight=ft.FontWeight.BOLD),
+            ft.Text("مرحباً بك في مدرب الكتابة", size=30, weight=_BOLD),
             ft.Text("Welcome to Typing Speed Trainer", size=20),
             ft.Divider(height=20, color="transparent"),
             self.username_field,
             self.language_dropdown,
-                ft.ElevatedButton(
-                    "ابدأ / Start",
-                    on_click=self.start_clicked,
-                    width=200,
-                style=ft.ButtonStyle(
-                    bgcolor={ft.ControlState.DEFAULT: "green"},
-                    color={ft.ControlState.DEFAULT: "white"},
-                )
-                )
+            ft.ElevatedButton(
+                "ابدأ / Start",
+                on_click=self.start_clicked,
+                width=200,
+                style=_START_BUTTON_STYLE
+            )
         ]
 
     def start_clicked(self, e):
         if not self.username_field.value:
             self.username_field.error_text = "الرجاء إدخال اسم المستخدم / Required"
-            self.username_field.update()
+            if self.username_field.page:
+                self.username_field.update()
             return
         
         self.on_complete(self.username_field.value, self.language_dropdown.value)
 
 
 class MainMenu(ft.Column):
+    __slots__ = (
+        "user_data", "stats",
+        "on_start_test", "on_manage_texts", "on_view_stats", "on_settings", "on_resume_quran",
+    )
+
+    # Menu button style per text/icon colour, shared by every menu build
+    _BUTTON_STYLES: Dict[str, ft.ButtonStyle] = {}
+
     def __init__(
         self, 
         user_data: Dict, 
@@ -76,11 +102,11 @@ class MainMenu(ft.Column):
         self.on_settings = on_settings
         self.on_resume_quran = on_resume_quran
 
-        self.horizontal_alignment = ft.CrossAxisAlignment.CENTER
-        self.alignment = ft.MainAxisAlignment.CENTER
+        self.horizontal_alignment = _CROSS_CENTER
+        self.alignment = _MAIN_CENTER
 
         self.controls = [
-            ft.Text(f"مرحباً {self.user_data['username']}", size=30, weight=ft.FontWeight.BOLD),
+            ft.Text(f"مرحباً {self.user_data['username']}", size=30, weight=_BOLD),
             ft.Text(f"المستوى: {self.user_data.get('level', 1)}", size=20, color="blue200"),
             ft.Divider(),
             
@@ -88,10 +114,10 @@ class MainMenu(ft.Column):
             ft.Row(
                 controls=[
                     self._stat_card("الاختبارات", str(self.stats['total_tests'])),
-                    self._stat_card("متوسط السرعة", f"{self.stats['average_wpm']} WPM"),
-                    self._stat_card("متوسط الدقة", f"{self.stats['average_accuracy']}%"),
+                    self._stat_card("متوسط السرعة", self.stats['wpm_display']),
+                    self._stat_card("متوسط الدقة", self.stats['accuracy_display']),
                 ],
-                alignment=ft.MainAxisAlignment.CENTER,
+                alignment=_MAIN_CENTER,
                 spacing=20
             ),
             
@@ -114,14 +140,15 @@ class MainMenu(ft.Column):
             )
         ]
 
-    def _stat_card(self, title, value):
+    @staticmethod
+    def _stat_card(title, value):
         return ft.Container(
             content=ft.Column(
                 controls=[
                     ft.Text(title, size=14, color="grey400"),
-                    ft.Text(value, size=24, weight=ft.FontWeight.BOLD),
+                    ft.Text(value, size=24, weight=_BOLD),
                 ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER
+                horizontal_alignment=_CROSS_CENTER
             ),
             bgcolor="surfaceVariant",
             padding=20,
@@ -129,21 +156,32 @@ class MainMenu(ft.Column):
             width=150
         )
 
+    def _on_menu_click(self, e):
+        # Shared by every menu button, each carries its callback in data
+        e.control.data()
+
     def _menu_button(self, text, icon, color, on_click):
+        style = self._BUTTON_STYLES.get(color)
+        if style is None:
+            style = ft.ButtonStyle(
+                shape=ft.RoundedRectangleBorder(radius=10),
+                bgcolor={_DEFAULT_STATE: "surfaceVariant"},
+                color={_DEFAULT_STATE: color},  # Text/Icon color
+            )
+            self._BUTTON_STYLES[color] = style
         return ft.ElevatedButton(
             text=text,
             icon=icon,
-            on_click=lambda e: on_click(),
+            data=on_click,
+            on_click=self._on_menu_click,
             height=50,
             width=400,
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=10),
-                bgcolor={ft.ControlState.DEFAULT: "surfaceVariant"},
-                color={ft.ControlState.DEFAULT: color},  # Text/Icon color
-            )
+            style=style
         )
 
 class ResultsScreen(ft.Column):
+    __slots__ = ("results", "on_retry", "on_home", "on_next")
+
     def __init__(self, results: Dict, on_retry: Callable, on_home: Callable, on_next: Optional[Callable] = None):
         super().__init__()
         self.results = results
@@ -151,21 +189,25 @@ class ResultsScreen(ft.Column):
         self.on_home = on_home
         self.on_next = on_next
 
-        self.horizontal_alignment = ft.CrossAxisAlignment.CENTER
-        self.alignment = ft.MainAxisAlignment.CENTER
+        self.horizontal_alignment = _CROSS_CENTER
+        self.alignment = _MAIN_CENTER
 
-        score_color = "green" if self.results['overall_score'] >= 70 else "orange"
+        score_color = _SCORE_COLORS[min(100, max(0, int(self.results['overall_score'])))]
+        missed = self.results.get('top_missed_keys') or ()
+        badges = [
+            self._missed_key_badge(char, count) for char, count in missed
+        ] if missed else [ft.Text("No errors! / لا يوجد أخطاء", color="green")]
         
         self.controls = [
-            ft.Text("نتيجة الاختبار / Test Results", size=30, weight=ft.FontWeight.BOLD),
+            ft.Text("نتيجة الاختبار / Test Results", size=30, weight=_BOLD),
             
             ft.Container(
                 content=ft.Column(
                     controls=[
-                        ft.Text(f"{self.results['overall_score']}", size=60, weight=ft.FontWeight.BOLD, color=score_color),
+                        ft.Text(f"{self.results['overall_score']}", size=60, weight=_BOLD, color=score_color),
                         ft.Text("النتيجة النهائية / Overall Score", size=16, color="grey400"),
                     ],
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER
+                    horizontal_alignment=_CROSS_CENTER
                 ),
                 padding=20
             ),
@@ -177,7 +219,7 @@ class ResultsScreen(ft.Column):
                     self._result_item("Errors", str(self.results['incorrect_keystrokes']), "red"),
                     self._result_item("Time", f"{self.results['duration']}s", "orange"),
                 ],
-                alignment=ft.MainAxisAlignment.CENTER,
+                alignment=_MAIN_CENTER,
                 spacing=30
             ),
             
@@ -189,15 +231,12 @@ class ResultsScreen(ft.Column):
                     controls=[
                         ft.Text("أكثر الحروف خطأ / Top Missed Keys", size=16, color="grey"),
                         ft.Row(
-                            controls=[
-                                self._missed_key_badge(char, count) 
-                                for char, count in self.results.get('top_missed_keys', [])
-                            ] if self.results.get('top_missed_keys') else [ft.Text("No errors! / لا يوجد أخطاء", color="green")],
-                            alignment=ft.MainAxisAlignment.CENTER,
+                            controls=badges,
+                            alignment=_MAIN_CENTER,
                             spacing=10
                         )
                     ],
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER
+                    horizontal_alignment=_CROSS_CENTER
                 ),
                 padding=10,
                 border=ft.border.all(1, "grey200"),
@@ -212,24 +251,26 @@ class ResultsScreen(ft.Column):
                     ft.ElevatedButton("إعادة المحاولة / Retry", icon=ft.Icons.REFRESH, on_click=lambda e: self.on_retry()),
                     ft.OutlinedButton("القائمة الرئيسية / Main Menu", icon=ft.Icons.HOME, on_click=lambda e: self.on_home()),
                 ],
-                alignment=ft.MainAxisAlignment.CENTER,
+                alignment=_MAIN_CENTER,
                 spacing=20
             )
         ]
     
-    def _result_item(self, label, value, color):
+    @staticmethod
+    def _result_item(label, value, color):
         return ft.Column(
             controls=[
-                ft.Text(value, size=28, weight=ft.FontWeight.BOLD, color=color),
+                ft.Text(value, size=28, weight=_BOLD, color=color),
                 ft.Text(label, size=14, color="grey400"),
             ],
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER
+            horizontal_alignment=_CROSS_CENTER
         )
 
-    def _missed_key_badge(self, char, count):
+    @staticmethod
+    def _missed_key_badge(char, count):
         return ft.Container(
             content=ft.Row([
-                ft.Text(f"'{char}'", size=20, weight=ft.FontWeight.BOLD, color="white"),
+                ft.Text(f"'{char}'", size=20, weight=_BOLD, color="white"),
                 ft.Text(f"{count}", size=14, color="white70")
             ], spacing=5),
             bgcolor="red400",
@@ -238,26 +279,28 @@ class ResultsScreen(ft.Column):
         )
 
 class StatisticsScreen(ft.Column):
+    __slots__ = ("stats", "on_back")
+
     def __init__(self, stats: Dict, on_back: Callable):
         super().__init__()
         self.stats = stats
         self.on_back = on_back
         
-        self.horizontal_alignment = ft.CrossAxisAlignment.CENTER
-        self.alignment = ft.MainAxisAlignment.CENTER
+        self.horizontal_alignment = _CROSS_CENTER
+        self.alignment = _MAIN_CENTER
         
         self.controls = [
-            ft.Text("الإحصائيات / Statistics", size=30, weight=ft.FontWeight.BOLD),
+            ft.Text("الإحصائيات / Statistics", size=30, weight=_BOLD),
             ft.Divider(height=20, color="transparent"),
             
             ft.Container(
                 content=ft.Row(
                     controls=[
                          self._big_stat("Tests Taken", str(self.stats.get('total_tests', 0)), "blue"),
-                         self._big_stat("Avg Speed", f"{self.stats.get('average_wpm', 0)} WPM", "green"),
-                         self._big_stat("Avg Accuracy", f"{self.stats.get('average_accuracy', 0)}%", "purple"),
+                         self._big_stat("Avg Speed", self.stats.get('wpm_display', "0 WPM"), "green"),
+                         self._big_stat("Avg Accuracy", self.stats.get('accuracy_display', "0%"), "purple"),
                     ],
-                    alignment=ft.MainAxisAlignment.CENTER,
+                    alignment=_MAIN_CENTER,
                     spacing=20
                 ),
                 padding=20
@@ -265,7 +308,7 @@ class StatisticsScreen(ft.Column):
             
             ft.Divider(),
             
-            ft.Text("Best Performances", size=20, weight=ft.FontWeight.BOLD),
+            ft.Text("Best Performances", size=20, weight=_BOLD),
             # Simple list of recent or best scores could go here, but for now just the summary
             
             ft.Container(height=50),
@@ -278,14 +321,15 @@ class StatisticsScreen(ft.Column):
             )
         ]
 
-    def _big_stat(self, label, value, color):
+    @staticmethod
+    def _big_stat(label, value, color):
         return ft.Container(
             content=ft.Column(
                  controls=[
-                     ft.Text(value, size=30, weight=ft.FontWeight.BOLD, color=color),
+                     ft.Text(value, size=30, weight=_BOLD, color=color),
                      ft.Text(label, size=14, color="grey400")
                  ],
-                 horizontal_alignment=ft.CrossAxisAlignment.CENTER
+                 horizontal_alignment=_CROSS_CENTER
             ),
             bgcolor="surfaceVariant",
             padding=20,
@@ -294,14 +338,16 @@ class StatisticsScreen(ft.Column):
         )
 
 class SettingsScreen(ft.Column):
+    __slots__ = ("current_theme_mode", "on_change_theme", "on_back", "theme_switch")
+
     def __init__(self, current_theme_mode: str, on_change_theme: Callable, on_back: Callable):
         super().__init__()
         self.current_theme_mode = current_theme_mode
         self.on_change_theme = on_change_theme
         self.on_back = on_back
         
-        self.horizontal_alignment = ft.CrossAxisAlignment.CENTER
-        self.alignment = ft.MainAxisAlignment.CENTER
+        self.horizontal_alignment = _CROSS_CENTER
+        self.alignment = _MAIN_CENTER
         
         self.theme_switch = ft.Switch(
             label="الوضع الليلي / Dark Mode", 
@@ -310,13 +356,13 @@ class SettingsScreen(ft.Column):
         )
         
         self.controls = [
-            ft.Text("الإعدادات / Settings", size=30, weight=ft.FontWeight.BOLD),
+            ft.Text("الإعدادات / Settings", size=30, weight=_BOLD),
             ft.Divider(height=20, color="transparent"),
             
             ft.Container(
                 content=ft.Column(
                     controls=[
-                        ft.Text("المظهر / Appearance", size=20, weight=ft.FontWeight.BOLD),
+                        ft.Text("المظهر / Appearance", size=20, weight=_BOLD),
                         self.theme_switch,
                     ]
                 ),
@@ -341,6 +387,12 @@ class SettingsScreen(ft.Column):
         self.on_change_theme(mode)
 
 class ManageTextsScreen(ft.Column):
+    __slots__ = (
+        "data_manager", "on_back",
+        "english_texts_list", "arabic_texts_list", "_list_keys", "_empty_labels",
+        "_tab_languages", "_built_tabs", "tabs",
+    )
+
     def __init__(self, data_manager, on_back: Callable):
         super().__init__()
         self.data_manager = data_manager
@@ -348,20 +400,28 @@ class ManageTextsScreen(ft.Column):
         
         self.english_texts_list = ft.ListView(expand=True, spacing=10)
         self.arabic_texts_list = ft.ListView(expand=True, spacing=10)
+        # Custom text ids each list was last built from, to skip no-op refreshes
+        self._list_keys = {"arabic": None, "english": None}
+        # "No custom texts" label per list, built once and reused when it empties again
+        self._empty_labels = {}
         
+        # Only the selected tab is built up front, the other on first selection
+        self._tab_languages = ["arabic", "english"]
+        self._built_tabs = {"arabic"}
         self.tabs = ft.Tabs(
             selected_index=0,
             animation_duration=300,
             tabs=[
                 ft.Tab(text="Arabic / العربية", content=self.build_tab_content("arabic")),
-                ft.Tab(text="English / الإنجليزية", content=self.build_tab_content("english")),
+                ft.Tab(text="English / الإنجليزية", content=ft.Container()),
             ],
+            on_change=self._on_tab_changed,
             expand=True
         )
         
         self.controls = [
             ft.Row([
-                ft.Text("إدارة النصوص / Manage Texts", size=30, weight=ft.FontWeight.BOLD),
+                ft.Text("إدارة النصوص / Manage Texts", size=30, weight=_BOLD),
                 ft.IconButton(ft.Icons.HOME, on_click=lambda e: self.on_back())
             ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
             ft.Divider(),
@@ -371,6 +431,16 @@ class ManageTextsScreen(ft.Column):
             )
         ]
     
+    def _on_tab_changed(self, e):
+        index = self.tabs.selected_index
+        language = self._tab_languages[index]
+        if language in self._built_tabs:
+            return
+        self._built_tabs.add(language)
+        self.tabs.tabs[index].content = self.build_tab_content(language)
+        if self.tabs.page:
+            self.tabs.update()
+
     def build_tab_content(self, language):
         # List Container
         list_view = self.arabic_texts_list if language == "arabic" else self.english_texts_list
@@ -394,11 +464,13 @@ class ManageTextsScreen(ft.Column):
             
             self.data_manager.add_custom_text(language, text_input.value, difficulty_dropdown.value)
             text_input.value = ""
-            text_input.update()
-            self.refresh_list(language)
+            self.refresh_list(language, defer_update=True)
+            # Cleared input and new list in one update
+            if tab_content.page:
+                tab_content.update()
             
         add_container = ft.Column([
-            ft.Text("إضافة نص جديد / Add New Text", weight=ft.FontWeight.BOLD),
+            ft.Text("إضافة نص جديد / Add New Text", weight=_BOLD),
             ft.Row([
                 text_input,
                 difficulty_dropdown,
@@ -406,16 +478,16 @@ class ManageTextsScreen(ft.Column):
             ])
         ], spacing=10)
 
-        return ft.Column([
+        tab_content = ft.Column([
             add_container,
             ft.Divider(),
             ft.Text("قائمة النصوص (تظهر النصوص المضافة فقط) / Custom Texts", color="grey"),
             list_view
         ], expand=True, spacing=20, scroll=ft.ScrollMode.HIDDEN)
+        return tab_content
 
-    def refresh_list(self, language):
+    def refresh_list(self, language, defer_update=False):
         list_view = self.arabic_texts_list if language == "arabic" else self.english_texts_list
-        list_view.controls.clear()
         
         texts = self.data_manager.get_texts(language)
         # Filter for custom only? Or show all?
@@ -423,32 +495,76 @@ class ManageTextsScreen(ft.Column):
         
         custom_texts = [t for t in texts if t.get("custom", False)]
         
-        if not custom_texts:
-            list_view.controls.append(ft.Text("لا يوجد نصوص مضافة / No custom texts found", italic=True, text_align=ft.TextAlign.CENTER))
+        # Nothing to redraw if the same texts are already listed
+        key = tuple(t["id"] for t in custom_texts)
+        if key == self._list_keys[language]:
+            return
+        self._list_keys[language] = key
         
-        for text in custom_texts:
-            t = text # capture for closure
-            list_view.controls.append(
-                ft.Container(
-                    content=ft.Row([
-                        ft.Column([
-                            ft.Text(t["text"][:50] + "..." if len(t["text"]) > 50 else t["text"], weight=ft.FontWeight.BOLD),
-                            ft.Text(f"Difficulty: {t.get('difficulty')} | ID: {t['id']}", size=12, color="grey")
-                        ], expand=True),
-                        ft.IconButton(
-                            ft.Icons.DELETE, 
-                            icon_color="red", 
-                            on_click=lambda e, lang=language, tid=t["id"]: self.delete_text(lang, tid)
-                        )
-                    ]),
-                    bgcolor="surfaceVariant",
-                    padding=10,
-                    border_radius=5
-                )
-            )
-        if list_view.page:
+        rows = [self._build_row(t, language) for t in custom_texts]
+        list_view.controls = rows if rows else [self._empty_label(language)]
+        if list_view.page and not defer_update:
             list_view.update()
 
+    def _empty_label(self, language):
+        # One per list: a control can't sit in both tabs' lists at once
+        label = self._empty_labels.get(language)
+        if label is None:
+            label = ft.Text("لا يوجد نصوص مضافة / No custom texts found", italic=True, text_align=_TEXT_CENTER)
+            self._empty_labels[language] = label
+        return label
+
+    def _build_row(self, t, language):
+        s = t["text"]
+        tid = t["id"]
+        diff = t.get("difficulty")
+        preview = s[:50] + "..." if len(s) > 50 else s
+        return ft.Container(
+            content=ft.Row([
+                ft.Column([
+                    ft.Text(preview, weight=_BOLD),
+                    ft.Text(f"Difficulty: {diff} | ID: {tid}", size=12, color="grey")
+                ], expand=True),
+                ft.IconButton(
+                    ft.Icons.DELETE, 
+                    icon_color="red", 
+                    on_click=functools.partial(self._on_delete_click, language, tid)
+                )
+            ]),
+            bgcolor="surfaceVariant",
+            padding=10,
+            border_radius=5
+        )
+
+    def _on_delete_click(self, language, text_id, e):
+        self.delete_text(language, text_id)
+
     def delete_text(self, language, text_id):
         self.data_manager.delete_custom_text(language, text_id)
         self.refresh_list(language)
+
+class LazyListView(ft.ListView):
+    # ListView that builds its items in batches, appending the next batch as
+    # the user scrolls near the end, so long lists don't ship every item up front
+    __slots__ = ("count", "build_item", "batch_size")
+
+    def __init__(self, count: int, build_item: Callable[[int], ft.Control], batch_size: int = 30, **kwargs):
+        super().__init__(on_scroll=self._on_scroll, on_scroll_interval=50, **kwargs)
+        self.count = count
+        self.build_item = build_item
+        self.batch_size = batch_size
+        self._load_more()
+
+    def _load_more(self):
+        start = len(self.controls)
+        end = min(start + self.batch_size, self.count)
+        self.controls.extend(self.build_item(i) for i in range(start, end))
+
+    def _on_scroll(self, e: ft.OnScrollEvent):
+        if len(self.controls) >= self.count or e.pixels is None:
+            return
+        # Within one viewport of the bottom: build the next batch
+        if e.pixels >= e.max_scroll_extent - e.viewport_dimension:
+            self._load_more()
+            if self.page:
+                self.update()